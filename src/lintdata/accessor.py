@@ -2,7 +2,9 @@
 Implements the core LintData accessor for pandas Dataframes
 """
 
-from typing import List
+import hashlib
+from collections import OrderedDict
+from typing import ClassVar, Hashable, List, Optional
 
 import pandas as pd
 
@@ -11,6 +13,10 @@ from . import checks
 
 @pd.api.extensions.register_dataframe_accessor("lint")
 class LintAccessor:
+    # Recently built reports, keyed by engine and a hash of the frame's content.
+    _report_cache: ClassVar["OrderedDict[Hashable, str]"] = OrderedDict()
+    _report_cache_size: ClassVar[int] = 32
+
     def __init__(self, pandas_obj: pd.DataFrame) -> None:
         self._validate(pandas_obj)
         self._df = pandas_obj
@@ -22,7 +28,77 @@ class LintAccessor:
                 "LintData accessor can only be used with pandas DataFrames."
             )
 
-    def report(self) -> str:
+    def report(self, engine: str = "pandas", use_cache: bool = True) -> str:
+        """Run all checks and format the findings as a text report.
+
+        Reports are cached in memory by the DataFrame's content, so repeated
+        calls on an unchanged frame return immediately. Any edit to the values,
+        index, columns or dtypes produces a new report.
+
+        Args:
+            engine (str, optional): ``"pandas"`` or ``"polars"``. The Polars
+            engine converts the DataFrame once and computes the column
+            statistics in one parallel query, which pays off on large frames.
+            Defaults to "pandas".
+            use_cache (bool, optional): Whether to reuse a cached report.
+            Defaults to True.
+
+        Returns:
+            str: The formatted report.
+        """
+        if engine not in ("pandas", "polars"):
+            raise ValueError("Engine must be either 'pandas' or 'polars'.")
+
+        key = self._cache_key(engine) if use_cache else None
+        cache = LintAccessor._report_cache
+
+        if key is not None and key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        report = self._build_report(engine)
+
+        if key is not None:
+            cache[key] = report
+            if len(cache) > LintAccessor._report_cache_size:
+                cache.popitem(last=False)
+
+        return report
+
+    def _cache_key(self, engine: str) -> Optional[Hashable]:
+        # hash_pandas_object hashes non-string objects by their str(), so 1 and
+        # "1" would collide while getting different reports. Only cache object
+        # columns, and categories, that hold nothing but strings (or nothing).
+        for i, dtype in enumerate(self._df.dtypes):
+            if isinstance(dtype, pd.CategoricalDtype):
+                values = dtype.categories
+            elif pd.api.types.is_object_dtype(dtype):
+                values = self._df.iloc[:, i]
+            else:
+                continue
+            if not pd.api.types.is_object_dtype(values.dtype):
+                continue
+            kind = pd.api.types.infer_dtype(values, skipna=True)
+            if kind not in ("string", "empty"):
+                return None
+
+        try:
+            row_hashes = pd.util.hash_pandas_object(self._df, index=True)
+        except TypeError:
+            # Cells holding unhashable objects (e.g. lists) are not cached
+            return None
+
+        digest = hashlib.blake2b(row_hashes.to_numpy().tobytes(), digest_size=16)
+        return (
+            engine,
+            self._df.shape,
+            # Labels compare by value, so 1 and 1.0 would share a key otherwise
+            tuple((type(col), col) for col in self._df.columns),
+            tuple(map(str, self._df.dtypes)),
+            digest.hexdigest(),
+        )
+
+    def _build_report(self, engine: str) -> str:
         report_lines = ["--- LintData Quality Report ---"]
 
         if self._df.empty:
@@ -32,21 +108,25 @@ class LintAccessor:
         report_lines.append(f"Shape: {self._df.shape}")
         report_lines.append("\nRunning checks...")
 
-        all_warnings: List[str] = []
-        all_warnings.extend(checks.check_missing_values(self._df))
-        all_warnings.extend(checks.check_duplicate_rows(self._df))
-        all_warnings.extend(checks.check_mixed_types(self._df))
-        all_warnings.extend(checks.check_whitespace(self._df))
-        all_warnings.extend(checks.check_constant_columns(self._df))
-        all_warnings.extend(checks.check_unique_columns(self._df))
-        all_warnings.extend(checks.check_outliers(self._df))
+        if engine == "polars":
+            try:
+                from . import polars_engine
+            except ImportError as e:
+                raise ImportError(
+                    "The 'polars' engine requires polars and pyarrow to be installed."
+                ) from e
+
+            all_warnings: List[str] = polars_engine.run_all(self._df)
+        else:
+            all_warnings = checks.run_all(self._df)
 
         if not all_warnings:
             report_lines.append("No issues found. DataFrame looks good!")
         else:
             report_lines.append(f"Found {len(all_warnings)} issue(s):")
-            for i, warning in enumerate(all_warnings, 1):
-                report_lines.append(f"  {i}. {warning}")
+            report_lines.extend(
+                f"  {i}. {warning}" for i, warning in enumerate(all_warnings, 1)
+            )
 
         report_lines.append("\n--- End of Report ---")
         return "\n".join(report_lines)
@@ -5,17 +5,60 @@ Each check is implemented as a function that takes a pandas DataFrame
 and returns a list of issues found. If no issues are found, an empty list is returned.
 """
 
-from typing import List, Optional
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
 
-def check_missing_values(df: pd.DataFrame) -> List[str]:
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+Emit = Callable[[str], None]
+
+# Below this many tasks, thread start-up costs more than it saves.
+_PARALLEL_MIN_TASKS = 8
+
+# Longest list of row labels spelled out in a duplicate-rows warning.
+_MAX_REPORTED_INDICES = 50
+
+# Leading values compared before a full scan when looking for constant columns.
+_CONSTANT_PROBE_SIZE = 1024
+
+# Leading or trailing whitespace, matching what str.strip() would remove.
+_PADDED_PATTERN = re.compile(r"\A\s|\s\Z")
+
+# Leading non-null values inspected before a full mixed-type scan.
+_MIXED_TYPES_SAMPLE_SIZE = 10_000
+
+# infer_dtype results that can mean more than one Python type. "date" also
+# covers datetime.date mixed with datetime.datetime.
+_MIXED_KINDS = frozenset({"mixed", "mixed-integer", "mixed-integer-float", "date"})
+
+
+def check_missing_values(
+    df: pd.DataFrame, na_counts: Optional[pd.Series] = None
+) -> List[str]:
     """Check for missing values in the DataFrame
 
     Args:
         df (pd.DataFrame): The pandas DataFrame to check
+        na_counts (pd.Series, optional): Precomputed ``df.isna().sum()``.
+        Computed on demand if not given.
 
     Returns:
         List[str]: A list of warning messages describing missing values found.
@@ -27,17 +70,23 @@ def check_missing_values(df: pd.DataFrame) -> List[str]:
     [Missing Values] Column 'a': 1 missing values (33.3%)
     """
     warnings: List[str] = []
-    missing_info = df.isna().sum()
+
+    if df.empty:
+        return warnings
+
+    missing_info = _na_counts(df) if na_counts is None else na_counts
     missing_cols = missing_info[missing_info > 0]
 
     if not missing_cols.empty:
-        total_rows = len(df)
-        for col, count in missing_cols.items():
-            percent = (count / total_rows) * 100
-            warnings.append(
-                f"[Missing Values] Column '{col}': {count} missing values "
-                f"({percent:.1f}%)"
+        # Percentages for every flagged column in one vectorised step
+        counts = missing_cols.to_numpy(dtype=np.int64)
+        percents = counts / len(df) * 100
+        warnings = [
+            _format_missing_values(col, count, percent)
+            for col, count, percent in zip(
+                missing_cols.index, counts.tolist(), percents.tolist()
             )
+        ]
 
     return warnings
 
@@ -47,6 +96,7 @@ def check_duplicate_rows(df: pd.DataFrame) -> List[str]:
 
     A row is considered a duplicate if all its values match another row in the
     DataFrame. The first occurrence is not counted as a duplicate. Indices start at 0.
+    At most 50 indices are listed; the rest are summarised as a count.
 
 
     Args:
@@ -63,30 +113,55 @@ def check_duplicate_rows(df: pd.DataFrame) -> List[str]:
     """
     warnings: List[str] = []
 
-    if df.empty:
+    if len(df) < 2 or len(df.columns) == 0:
         return warnings
 
-    duplicate_mask = df.duplicated()
-    duplicate_indices = df.index[duplicate_mask].tolist()
+    # A single column without repeats makes every row distinct. The probe is
+    # bounded so that frames without such a column do not pay for hashing
+    # every column before duplicated() hashes the rows anyway: numeric columns
+    # are tried first, sorted ones and narrow integer ranges need no hashing,
+    # and at most one object column is hashed.
+    is_object = [pd.api.types.is_object_dtype(dtype) for dtype in df.dtypes]
+    for i in sorted(range(len(df.columns)), key=is_object.__getitem__):
+        s = df.iloc[:, i]
+        if _is_strictly_monotonic(s):
+            return warnings
+
+        max_unique = _max_unique(s)
+        if max_unique is not None and max_unique < len(df):
+            continue
 
-    if len(duplicate_indices) > 0:
-        indices_str = ", ".join(map(str, duplicate_indices))
-        warnings.append(
-            f"[Duplicate Rows] Found {len(duplicate_indices)} duplicate row(s) "
-            f"at index: {indices_str}"
-        )
+        if s.is_unique:
+            return warnings
+
+        if is_object[i]:
+            break
+
+    # One hashed pass over the rows; the first occurrence is not a duplicate.
+    # groupby(...).indices gives the same positions but builds an array per
+    # group, which is about 10x slower on a million rows.
+    duplicate_mask = df.duplicated(keep="first")
+    positions = np.flatnonzero(duplicate_mask.to_numpy())
+
+    if len(positions) > 0:
+        warnings.append(_format_duplicate_rows(df.index, positions))
 
     return warnings
 
 
-def check_mixed_types(df: pd.DataFrame) -> List[str]:
+def check_mixed_types(
+    df: pd.DataFrame, na_mask: Optional[pd.DataFrame] = None
+) -> List[str]:
     """Check for columns containing mixed data types.
 
     Detects columns where values have different Python types (e.g., integers
     mixed with strings). Reports the specific types found and their proportions.
+    Only object columns are scanned, as other dtypes hold a single type.
 
     Args:
         df (pd.DataFrame): The pandas DataFrame to check.
+        na_mask (pd.DataFrame, optional): Precomputed ``df.isna()``.
+        Computed on demand if not given.
 
     Returns:
         List[str]: A list of warning messages for mixed data types found with specific
@@ -102,42 +177,17 @@ def check_mixed_types(df: pd.DataFrame) -> List[str]:
     if df.empty:
         return warnings
 
-    for col in df.columns:
-        if df[col].isna().all():
-            continue
-
-        non_null_values = df[col].dropna()
-
-        if len(non_null_values) == 0:
-            continue
-
-        type_counts = {}
-        for value in non_null_values:
-            value_type = type(value).__name__
-            type_counts[value_type] = type_counts.get(value_type, 0) + 1
+    object_columns = df.columns[_classify_columns(df).objects]
 
-        if len(type_counts) > 1:
-            total = len(non_null_values)
-
-            sorted_types = sorted(type_counts.items(), key=lambda x: x[1], reverse=True)
-
-            type_breakdown = ", ".join(
-                [
-                    f"{type_name} ({count / total * 100:.0f}%)"
-                    for type_name, count in sorted_types
-                ]
-            )
-
-            warnings.append(
-                f"[Mixed Types] Column '{col}' has mixed types: {type_breakdown}"
-            )
-
-    return warnings
+    return _check_columns(
+        object_columns, lambda col: _mixed_types(_non_null(df, col, na_mask))
+    )
 
 
 def check_whitespace(df: pd.DataFrame) -> List[str]:
     """Detects string values that have leading or trailing spaces,
     which can cause issues in data analysis and matching operations.
+    Uses pyarrow's string kernels when it is installed.
 
     Args:
         df (pd.DataFrame): The pandas DataFrame to check.
@@ -157,28 +207,15 @@ def check_whitespace(df: pd.DataFrame) -> List[str]:
     if df.empty:
         return warnings
 
-    string_columns = df.select_dtypes(include=["object"]).columns
+    string_columns = df.columns[_classify_columns(df).strings]
 
-    for col in string_columns:
-        if df[col].isna().all():
-            continue
-
-        non_null_values = df[col].dropna()
-
-        has_whitespace = (
-            non_null_values.astype(str) != non_null_values.astype(str).str.strip()
-        )
-        whitespace_count = has_whitespace.sum()
+    # No dropna() copy needed: missing values never count as padded.
+    return _check_columns(string_columns, lambda col: _whitespace(df[col]))
 
-        if whitespace_count > 0:
-            warnings.append(
-                f"[Whitespace] Column '{col}' has {whitespace_count} value(s) "
-                f"with leading or trailing whitespace."
-            )
-    return warnings
 
-
-def check_constant_columns(df: pd.DataFrame) -> List[str]:
+def check_constant_columns(
+    df: pd.DataFrame, na_mask: Optional[pd.DataFrame] = None
+) -> List[str]:
     """Check for columns where all values are the same (zero variance).
 
     Identifies columns with only one unique value (excluding NaN), which are often
@@ -186,6 +223,8 @@ def check_constant_columns(df: pd.DataFrame) -> List[str]:
 
     Args:
         df (pd.DataFrame): The pandas DataFrame to check.
+        na_mask (pd.DataFrame, optional): Precomputed ``df.isna()``.
+        Computed on demand if not given.
 
     Returns:
         List[str]: A list of warning messages for constant columns found.
@@ -201,31 +240,15 @@ def check_constant_columns(df: pd.DataFrame) -> List[str]:
     if df.empty:
         return warnings
 
-    for col in df.columns:
-        unique_values = df[col].dropna().unique()
-
-        if len(unique_values) == 0:
-            warnings.append(
-                f"[Constant Column] Column '{col}' contains only missing values."
-            )
-
-        elif len(unique_values) == 1:
-            constant_value = unique_values[0]
-
-            if isinstance(constant_value, str):
-                display_value = f"'{constant_value}'"
-            else:
-                display_value = str(constant_value)
-
-            warnings.append(
-                f"[Constant Column] Column '{col}'"
-                f" has only one unique value: {display_value}."
-            )
-    return warnings
+    return _check_columns(
+        df.columns, lambda col: _constant(_non_null(df, col, na_mask))
+    )
 
 
 def check_unique_columns(
-    df: pd.DataFrame, threshold: Optional[float] = 0.95
+    df: pd.DataFrame,
+    threshold: Optional[float] = 0.95,
+    na_counts: Optional[pd.Series] = None,
 ) -> List[str]:
     """Check for columns with a high proportion of unique values.
 
@@ -233,6 +256,8 @@ def check_unique_columns(
         df (pd.DataFrame): The pandas DataFrame to check.
         threshold (float, optional): The unique value proportion threshold.
         Defaults to 0.95.
+        na_counts (pd.Series, optional): Precomputed ``df.isna().sum()``.
+        Counted per column if not given.
 
     Returns:
         List[str]: A list of warning messages for columns exceeding
@@ -255,26 +280,36 @@ def check_unique_columns(
     if df.empty:
         return warnings
 
-    for col in df.columns:
-        non_null_values = df[col].dropna()
+    def check_column(col) -> Optional[str]:
+        total_non_null = None if na_counts is None else len(df) - na_counts[col]
+        return _unique(df[col], threshold, total_non_null)
 
-        if len(non_null_values) == 0:
-            continue
-
-        num_unique = non_null_values.nunique()
-        total_non_null = len(non_null_values)
-        unique_ratio = num_unique / total_non_null
-
-        if unique_ratio >= threshold:
-            percent = unique_ratio * 100
-            warnings.append(f"[Unique Column] Column '{col}' is {percent:.1f}% unique")
-
-    return warnings
+    return _check_columns(df.columns, check_column)
 
 
 def check_outliers(
-    df: pd.DataFrame, method: Optional[str] = "iqr", threshold: Optional[float] = 1.5
+    df: pd.DataFrame,
+    method: Optional[str] = "iqr",
+    threshold: Optional[float] = 1.5,
+    use_numba: bool = False,
 ) -> List[str]:
+    """Detects potential outliers in numeric columns using the IQR method.
+
+    Args:
+        df (pd.DataFrame): The pandas DataFrame to check.
+        method (str, optional): The outlier detection method. Only ``"iqr"``
+        is supported. Defaults to ``"iqr"``.
+        threshold (float, optional): How many IQRs beyond the quartiles a value
+        must lie to be flagged. Defaults to 1.5.
+        use_numba (bool, optional): Count outliers with the parallel Numba
+        kernel (``numba`` extra). Its first call in a fresh environment
+        compiles the kernel, which takes several seconds. Numba's partition
+        is slower than NumPy's, so it only pays off on large blocks whose
+        columns spread over several cores. Defaults to False.
+
+    Returns:
+        List[str]: A list of warning messages for columns with outliers.
+    """
     warnings: List[str] = []
 
     if method != "iqr":
@@ -291,31 +326,612 @@ def check_outliers(
     if df.empty:
         return warnings
 
-    numeric_columns = df.select_dtypes(include=[np.number]).columns
+    numeric = df.loc[:, _classify_columns(df).numeric]
+    counts = _outlier_counts(numeric, threshold, use_numba)
+
+    return [
+        _format_outliers(col, count)
+        for col, count in zip(numeric.columns, counts.tolist())
+        if count > 0
+    ]
+
+
+def run_all(
+    df: pd.DataFrame, emit: Optional[Emit] = None, use_numba: bool = False
+) -> List[str]:
+    """Run every check over the DataFrame in a single pass over its columns.
+
+    The NA mask is computed once for the whole frame and each column's non-null
+    values are sliced out once, then shared by all of the per-column checks.
+    Checks use their default thresholds. Row-level issues are reported first,
+    followed by the issues for each column in column order.
+
+    Args:
+        df (pd.DataFrame): The pandas DataFrame to check.
+        emit (Callable[[str], None], optional): Called with each warning, in
+        report order, instead of collecting them into the returned list.
+        use_numba (bool, optional): Passed on to ``check_outliers``.
+        Defaults to False.
+
+    Returns:
+        List[str]: A list of warning messages from all checks, or an empty list
+        if ``emit`` is given.
+
+    Example:
+    >>> df = pd.DataFrame({'a': [1, 1, None], 'b': ['x', 'y', 'z']})
+    >>> for warning in run_all(df):
+    ...     print(warning)
+    [Missing Values] Column 'a': 1 missing values (33.3%)
+    [Constant Column] Column 'a' has only one unique value: 1.0.
+    [Unique Column] Column 'b' is 100.0% unique
+    """
+    warnings: List[str] = []
+
+    if emit is None:
+        emit = warnings.append
+
+    if df.empty:
+        return warnings
+
+    na_mask = df.isna()
+    na_counts = na_mask.sum(axis=0)
+    total_rows = len(df)
+
+    # Route columns by dtype once, so each check only sees columns it applies to:
+    # numeric columns cannot hold mixed types or padded strings.
+    kinds = _classify_columns(df)
+    numeric = df.loc[:, kinds.numeric]
+    object_columns = set(df.columns[kinds.objects])
+    string_columns = set(df.columns[kinds.strings])
+    outlier_counts = dict(
+        zip(numeric.columns, _outlier_counts(numeric, use_numba=use_numba))
+    )
+
+    def check_rows(emit: Emit) -> None:
+        for warning in check_duplicate_rows(df):
+            emit(warning)
+
+    def check_column(col, emit: Emit) -> None:
+        nn = _non_null(df, col, na_mask)
+
+        if na_counts[col] > 0:
+            count = na_counts[col]
+            emit(_format_missing_values(col, count, count / total_rows * 100))
+
+        if col in object_columns:
+            warning = _mixed_types(nn)
+            if warning:
+                emit(warning)
+
+        if col in string_columns:
+            warning = _whitespace(nn)
+            if warning:
+                emit(warning)
+
+        for warning in _constant_and_unique(nn):
+            if warning:
+                emit(warning)
+
+        if outlier_counts.get(col, 0) > 0:
+            emit(_format_outliers(col, outlier_counts[col]))
+
+    tasks = [check_rows]
+    tasks.extend(partial(check_column, col) for col in df.columns)
+    _run_tasks(tasks, emit)
+
+    return warnings
+
+
+class _ColumnKinds(NamedTuple):
+    """Boolean masks over ``df.columns`` for the dtypes the checks route on."""
+
+    numeric: np.ndarray
+    objects: np.ndarray
+    strings: np.ndarray
+
+
+def _classify_columns(df: pd.DataFrame) -> _ColumnKinds:
+    """Classify every column in one pass over ``df.dtypes``.
+
+    Matches ``select_dtypes`` for ``np.number`` (less complex numbers),
+    ``"object"`` and ``["object", "string"]`` without building a sub-frame
+    for each.
+    """
+    rows = [_dtype_kinds(dtype) for dtype in df.dtypes]
+    masks = np.array(rows, dtype=bool).reshape(-1, 3)
+    return _ColumnKinds(masks[:, 0], masks[:, 1], masks[:, 2])
+
+
+# Wide frames repeat a handful of dtypes, and the same dtypes recur across
+# calls, so each is only inspected once. Dtypes are immutable, which makes this
+# safe to cache, unlike results keyed on a DataFrame's identity.
+@lru_cache(maxsize=256)
+def _dtype_kinds(dtype) -> Tuple[bool, bool, bool]:
+    """``(numeric, object, string)`` flags for a dtype, as in ``_ColumnKinds``."""
+    # select_dtypes counts timedelta64 as a number, but not booleans. Complex
+    # numbers are left out too: they have no ordering for quartiles to use.
+    # ArrowDtype calls decimals numeric, but select_dtypes leaves them out.
+    is_timedelta = dtype.kind == "m"
+    is_numeric = pd.api.types.is_numeric_dtype(dtype) and dtype.kind != "O"
+    is_bool = pd.api.types.is_bool_dtype(dtype)
+    is_complex = pd.api.types.is_complex_dtype(dtype)
+
+    return (
+        is_timedelta or (is_numeric and not (is_bool or is_complex)),
+        pd.api.types.is_object_dtype(dtype),
+        _holds_strings(dtype),
+    )
+
+
+def _run_tasks(tasks: List[Callable[[Emit], None]], emit: Emit) -> None:
+    """Run independent tasks that report through ``emit``, in task order.
+
+    Tasks run on a thread pool when there are enough of them, since the heavy
+    pandas and NumPy kernels used by the checks release the GIL. Pooled tasks
+    write to their own buffer, which is forwarded once the earlier tasks are
+    done, so the output order never depends on scheduling.
+    """
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+
+    if len(tasks) < _PARALLEL_MIN_TASKS or max_workers < 2:
+        for task in tasks:
+            task(emit)
+        return
+
+    def buffered(task: Callable[[Emit], None]) -> List[str]:
+        buffer: List[str] = []
+        task(buffer.append)
+        return buffer
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(buffered, task) for task in tasks]
+        for future in futures:
+            for warning in future.result():
+                emit(warning)
 
-    for col in numeric_columns:
-        non_null_values = df[col].dropna()
 
-        if len(non_null_values) == 0:
+def _check_columns(columns, check: Callable[[object], Optional[str]]) -> List[str]:
+    """Apply a single-column check to each column, keeping column order.
+
+    Goes through ``_run_tasks``, so wide frames are checked on the thread pool.
+    """
+    warnings: List[str] = []
+
+    def task(col, emit: Emit) -> None:
+        warning = check(col)
+        if warning:
+            emit(warning)
+
+    _run_tasks([partial(task, col) for col in columns], warnings.append)
+    return warnings
+
+
+def _na_counts(df: pd.DataFrame) -> pd.Series:
+    """Per-column missing-value counts, without building the full ``df.isna()``."""
+    counts = []
+
+    for i, dtype in enumerate(df.dtypes):
+        # Only NumPy dtypes qualify: nullable extension dtypes like Int64 share
+        # the integer kind but can hold pd.NA.
+        if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+            counts.append(0)
+        elif isinstance(dtype, np.dtype) and dtype.kind in "fc":
+            counts.append(np.count_nonzero(np.isnan(df.iloc[:, i].to_numpy())))
+        else:
+            counts.append(int(df.iloc[:, i].isna().sum()))
+
+    return pd.Series(counts, index=df.columns, dtype=np.int64)
+
+
+def _non_null(
+    df: pd.DataFrame, col, na_mask: Optional[pd.DataFrame] = None
+) -> pd.Series:
+    """Slice a column's non-null values, reusing a precomputed NA mask if given."""
+    s = df[col]
+
+    if na_mask is None:
+        return s.dropna() if s.hasnans else s
+
+    # Columns without missing values are returned as-is rather than copied.
+    mask = na_mask[col].to_numpy()
+    return s[~mask] if mask.any() else s
+
+
+def _format_duplicate_rows(index: pd.Index, positions: np.ndarray) -> str:
+    # Only the listed labels are looked up and stringified, however many
+    # duplicates there are.
+    shown = index[positions[:_MAX_REPORTED_INDICES]]
+    indices_str = ", ".join(map(str, shown))
+    hidden = len(positions) - len(shown)
+
+    if hidden:
+        indices_str += f", ... (+{hidden} more)"
+
+    return (
+        f"[Duplicate Rows] Found {len(positions)} duplicate row(s) "
+        f"at index: {indices_str}"
+    )
+
+
+def _format_missing_values(col, count: int, percent: float) -> str:
+    return f"[Missing Values] Column '{col}': {count} missing values ({percent:.1f}%)"
+
+
+def _format_whitespace(col, count: int) -> str:
+    return (
+        f"[Whitespace] Column '{col}' has {count} value(s) "
+        f"with leading or trailing whitespace."
+    )
+
+
+def _format_constant(col, constant_value) -> str:
+    if constant_value is None:
+        return f"[Constant Column] Column '{col}' contains only missing values."
+
+    if isinstance(constant_value, str):
+        display_value = f"'{constant_value}'"
+    else:
+        display_value = str(constant_value)
+
+    return (
+        f"[Constant Column] Column '{col}' has only one unique value: {display_value}."
+    )
+
+
+def _format_unique(col, unique_ratio: float) -> str:
+    percent = unique_ratio * 100
+    return f"[Unique Column] Column '{col}' is {percent:.1f}% unique"
+
+
+def _format_outliers(col, count: int) -> str:
+    return (
+        f"[Outliers] Column '{col}': {count} potential outlier(s) "
+        f"detected (iqr method)."
+    )
+
+
+def _mixed_types(nn: pd.Series) -> Optional[str]:
+    if nn.dtype != object or len(nn) == 0:
+        return None
+
+    # Dirty columns usually show it early, so look at a prefix first and only
+    # scan the whole column when the prefix is homogeneous.
+    values = nn.to_numpy()
+    sample = values[:_MIXED_TYPES_SAMPLE_SIZE]
+    type_counts = _type_name_counts(sample)
+
+    if len(type_counts) > 1:
+        return _format_mixed_types(
+            nn.name, type_counts, len(sample), sampled=len(sample) < len(values)
+        )
+
+    if len(sample) == len(values):
+        return None
+
+    type_counts = _type_name_counts(values)
+
+    if len(type_counts) <= 1:
+        return None
+
+    return _format_mixed_types(nn.name, type_counts, len(values))
+
+
+def _type_name_counts(values: np.ndarray) -> Counter:
+    """Count the Python type names in an object array, if it holds mixed types."""
+    # infer_dtype is a single Cython pass; only arrays it calls mixed need the
+    # per-value type count below.
+    if pd.api.types.infer_dtype(values, skipna=True) not in _MIXED_KINDS:
+        return Counter()
+
+    # Counter and map run their loops in C; keying on the type objects avoids
+    # a __name__ lookup per value, and names are only resolved per distinct type.
+    type_counts: Counter = Counter()
+    for value_type, count in Counter(map(type, values)).items():
+        type_counts[value_type.__name__] += count
+
+    return type_counts
+
+
+def _format_mixed_types(
+    col, type_counts: Counter, total: int, sampled: bool = False
+) -> str:
+    type_breakdown = ", ".join(
+        [
+            f"{type_name} ({count / total * 100:.0f}%)"
+            for type_name, count in type_counts.most_common()
+        ]
+    )
+    message = f"[Mixed Types] Column '{col}' has mixed types: {type_breakdown}"
+
+    if sampled:
+        message += f" (in the first {total} non-null values)"
+
+    return message
+
+
+def _whitespace(s: pd.Series) -> Optional[str]:
+    if len(s) == 0:
+        return None
+
+    if not _holds_strings(s.dtype):
+        return None
+
+    whitespace_count = _arrow_whitespace_count(s)
+
+    if whitespace_count is None:
+        whitespace_count = _pandas_whitespace_count(s)
+
+    if whitespace_count == 0:
+        return None
+
+    return _format_whitespace(s.name, whitespace_count)
+
+
+def _holds_strings(dtype) -> bool:
+    if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.StringDtype):
+        return True
+
+    # ArrowDtype can only exist when pyarrow is installed
+    return isinstance(dtype, pd.ArrowDtype) and (
+        pa.types.is_string(dtype.pyarrow_dtype)
+        or pa.types.is_large_string(dtype.pyarrow_dtype)
+    )
+
+
+def _to_arrow_strings(s: pd.Series):
+    """The column as an Arrow string array, or None if pyarrow cannot take it.
+
+    Object columns are converted here, which is most of the cost of the Arrow
+    path. Success does not prove a column is all ``str``: pyarrow also accepts
+    ``bytes`` values, so it is no substitute for the mixed-type check.
+    """
+    if pa is None:
+        return None
+
+    try:
+        if isinstance(s.dtype, (pd.ArrowDtype, pd.StringDtype)):
+            # Arrow-backed columns hand over their buffers as they are
+            return pa.array(s.array)
+        return pa.array(s, type=pa.string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Object columns holding non-strings are left to the pandas path
+        return None
+
+
+def _arrow_whitespace_count(s: pd.Series) -> Optional[int]:
+    """Count padded strings with Arrow's C++ kernels, if pyarrow can take them."""
+    arr = _to_arrow_strings(s)
+
+    if arr is None:
+        return None
+
+    trimmed = pc.utf8_trim_whitespace(arr)
+    padded = pc.not_equal(pc.utf8_length(arr), pc.utf8_length(trimmed))
+    return pc.sum(padded).as_py() or 0
+
+
+def _pandas_whitespace_count(s: pd.Series) -> int:
+    # One regex search per string touches only its ends, where strip() would
+    # build a new string and need a second length pass to compare against.
+    try:
+        padded = s.str.contains(_PADDED_PATTERN, na=False)
+    except AttributeError:
+        # Object columns without any strings (e.g. only booleans) have no .str
+        return 0
+
+    # Missing and non-string values come back as na, counted as unpadded.
+    return int(padded.sum())
+
+
+def _constant(nn: pd.Series) -> Optional[str]:
+    if len(nn) == 0:
+        return _format_constant(nn.name, None)
+
+    # Reported through iloc, so datetime and timedelta values stay boxed.
+    constant_value = nn.iloc[0]
+    values = nn.to_numpy()
+
+    # Boolean reductions allocate no comparison array at all.
+    if values.dtype == np.bool_:
+        if values.all() or not values.any():
+            return _format_constant(nn.name, constant_value)
+        return None
+
+    # Comparing objects with == broadcasts sequences such as tuples, so they
+    # are hashed instead; a short prefix still settles most varying columns.
+    if values.dtype == object:
+        if len(pd.unique(values[:_CONSTANT_PROBE_SIZE])) > 1:
+            return None
+        if len(pd.unique(values)) > 1:
+            return None
+        return _format_constant(nn.name, constant_value)
+
+    # Comparing against the first value needs no hashtable or uniques array,
+    # unlike nunique(), which is len(unique()) under the hood. Most columns
+    # that vary do so early, so a short prefix settles them without a full scan.
+    first = values[0]
+
+    if not (values[:_CONSTANT_PROBE_SIZE] == first).all():
+        return None
+
+    if not (values[_CONSTANT_PROBE_SIZE:] == first).all():
+        return None
+
+    return _format_constant(nn.name, constant_value)
+
+
+def _constant_and_unique(
+    nn: pd.Series, threshold: float = 0.95
+) -> Tuple[Optional[str], Optional[str]]:
+    """Constant- and unique-column warnings for a column's non-null values.
+
+    Object columns are hashed once and both checks read the result, since
+    comparing or hashing Python objects twice is the expensive part. Other
+    columns found constant have exactly one distinct value, so they are not
+    hashed for the unique check at all.
+    """
+    if len(nn) == 0:
+        return _constant(nn), None
+
+    if nn.dtype != object:
+        constant = _constant(nn)
+        if constant is None:
+            return None, _unique(nn, threshold)
+        return constant, _unique_from_count(nn.name, 1, len(nn), threshold)
+
+    uniques = pd.unique(nn.to_numpy())
+
+    constant = _format_constant(nn.name, uniques[0]) if len(uniques) == 1 else None
+    unique = _unique_from_count(nn.name, len(uniques), len(nn), threshold)
+    return constant, unique
+
+
+def _unique_from_count(
+    col, num_unique: int, total_non_null: int, threshold: float
+) -> Optional[str]:
+    unique_ratio = num_unique / total_non_null
+
+    if unique_ratio < threshold:
+        return None
+
+    return _format_unique(col, unique_ratio)
+
+
+def _unique(
+    s: pd.Series, threshold: float = 0.95, total_non_null: Optional[int] = None
+) -> Optional[str]:
+    if total_non_null is None:
+        total_non_null = s.count()
+
+    if total_non_null == 0:
+        return None
+
+    # A min/max pass can rule a column out without hashing its values.
+    max_unique = _max_unique(s)
+    if max_unique is not None and max_unique / total_non_null < threshold:
+        return None
+
+    if _is_strictly_monotonic(s):
+        num_unique = total_non_null
+    else:
+        num_unique = s.nunique(dropna=True)
+
+    return _unique_from_count(s.name, num_unique, total_non_null, threshold)
+
+
+def _max_unique(s: pd.Series) -> Optional[int]:
+    """Upper bound on the distinct values of a bool or integer column, if cheap."""
+    if not isinstance(s.dtype, np.dtype) or len(s) == 0:
+        return None
+
+    if s.dtype.kind == "b":
+        return 2
+
+    if s.dtype.kind in "iu":
+        values = s.to_numpy()
+        # Python ints, so the span of a wide uint64 or int64 range cannot overflow
+        return int(values.max()) - int(values.min()) + 1
+
+    return None
+
+
+def _is_strictly_monotonic(s: pd.Series) -> bool:
+    """Cheap uniqueness proof for sorted numeric columns, without hashing."""
+    if not pd.api.types.is_numeric_dtype(s):
+        return False
+
+    # pandas has no float16 index engine to answer is_monotonic with; float32
+    # holds every float16 value exactly.
+    if s.dtype == np.float16:
+        s = s.astype(np.float32)
+
+    if not (s.is_monotonic_increasing or s.is_monotonic_decreasing):
+        return False
+
+    values = s.to_numpy()
+    return bool((values[1:] != values[:-1]).all())
+
+
+def _outlier_counts(
+    numeric: pd.DataFrame, threshold: float = 1.5, use_numba: bool = False
+) -> np.ndarray:
+    """Count IQR outliers in every column of an all-numeric DataFrame."""
+    if use_numba and _iqr_outlier_counts_jit is None:
+        raise ImportError("use_numba=True requires numba to be installed.")
+
+    # Column-major for a single float block, so each column slice is contiguous.
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # NaT survives the float conversion as the int64 minimum rather than NaN.
+    for i, dtype in enumerate(numeric.dtypes):
+        if isinstance(dtype, np.dtype) and dtype.kind == "m":
+            values[numeric.iloc[:, i].isna().to_numpy(), i] = np.nan
+
+    if use_numba:
+        return _iqr_outlier_counts_jit(values, threshold)
+
+    # Infinite values make inf - inf quartile arithmetic; the resulting NaN
+    # bounds flag nothing, which is the intended result, so skip the warnings.
+    with np.errstate(invalid="ignore", over="ignore"):
+        return _iqr_outlier_counts(values, threshold)
+
+
+def _iqr_outlier_counts(values: np.ndarray, threshold: float) -> np.ndarray:
+    # Compiled with Numba when it is installed, so only use constructs it supports.
+    n_cols = values.shape[1]
+    counts = np.zeros(n_cols, dtype=np.int64)
+
+    for j in prange(n_cols):
+        column = values[:, j]
+        missing = np.isnan(column)
+        # np.partition copies anyway, so complete columns skip the filter copy
+        finite = column[~missing] if missing.any() else column
+
+        if finite.size == 0:
             continue
 
-        q1 = non_null_values.quantile(0.25)
-        q3 = non_null_values.quantile(0.75)
+        # Select the order statistics either side of each quartile in one O(n)
+        # partition, then interpolate linearly exactly as np.quantile does.
+        n = finite.size
+        h1 = (n - 1) * 0.25
+        h3 = (n - 1) * 0.75
+        lo1 = int(np.floor(h1))
+        lo3 = int(np.floor(h3))
+        hi1 = min(lo1 + 1, n - 1)
+        hi3 = min(lo3 + 1, n - 1)
+        part = np.partition(finite, np.array([lo1, hi1, lo3, hi3]))
+
+        t1 = h1 - lo1
+        t3 = h3 - lo3
+        diff1 = part[hi1] - part[lo1]
+        diff3 = part[hi3] - part[lo3]
+        q1 = part[lo1] + diff1 * t1 if t1 < 0.5 else part[hi1] - diff1 * (1 - t1)
+        q3 = part[lo3] + diff3 * t3 if t3 < 0.5 else part[hi3] - diff3 * (1 - t3)
+
+        # A quartile landing exactly on an order statistic is that value; the
+        # lerp would turn an infinite neighbour into inf * 0 = NaN.
+        if t1 == 0:
+            q1 = part[lo1]
+        if t3 == 0:
+            q3 = part[lo3]
         iqr = q3 - q1
 
         if iqr == 0:
             continue
 
+        # The partition already orders values around the quartiles: nothing
+        # after position lo1 can fall below the lower bound, and nothing up to
+        # lo3 can exceed the upper one, so only the outer quarters are scanned.
         lower_bound = q1 - threshold * iqr
         upper_bound = q3 + threshold * iqr
+        counts[j] = np.count_nonzero(part[: lo1 + 1] < lower_bound) + np.count_nonzero(
+            part[lo3 + 1 :] > upper_bound
+        )
 
-        outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-        outlier_count = len(outliers)
+    return counts
 
-        if outlier_count > 0:
-            warnings.append(
-                f"[Outliers] Column '{col}': {outlier_count} potential outlier(s) "
-                f"detected ({method} method)."
-            )
 
-    return warnings
+if njit is not None:
+    _iqr_outlier_counts_jit = njit(parallel=True, cache=True)(_iqr_outlier_counts)
+else:
+    _iqr_outlier_counts_jit = None
@@ -0,0 +1,132 @@
+"""
+A Polars-backed implementation of ``run_all`` for large DataFrames.
+
+The DataFrame is converted to Polars once and every per-column statistic is
+computed in a single ``select``, which Polars evaluates in parallel. Warnings
+are formatted exactly as the pandas checks format them, in the same order.
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from . import checks
+
+
+def run_all(df: pd.DataFrame) -> List[str]:
+    """Run every check over the DataFrame using Polars.
+
+    Checks use their default thresholds. Frames that Polars cannot represent
+    (e.g. object columns mixing strings and numbers, or complex columns) are
+    checked with
+    ``checks.run_all`` instead.
+
+    Args:
+        df (pd.DataFrame): The pandas DataFrame to check.
+
+    Returns:
+        List[str]: A list of warning messages from all checks.
+    """
+    warnings: List[str] = []
+
+    if df.empty:
+        return warnings
+
+    # Positional names sidestep non-string and duplicate column labels.
+    names = [str(i) for i in range(len(df.columns))]
+
+    try:
+        pl_df = pl.from_pandas(df.set_axis(names, axis=1))
+    except (TypeError, ValueError, pa.ArrowException, pl.exceptions.PolarsError):
+        # ArrowNotImplementedError (e.g. complex columns) is not a ValueError
+        return checks.run_all(df)
+
+    stats = pl_df.select(_stat_expressions(pl_df)).row(0, named=True)
+
+    # A column Polars read as String held only str values; others, such as ints
+    # mixed with floats or dates mixed with datetimes, may have been coerced to
+    # fewer distinct values, so anything that compares them is left to pandas.
+    coerced = [
+        df.iloc[:, i].dtype == object and pl_df.schema[name] != pl.String
+        for i, name in enumerate(names)
+    ]
+
+    if any(coerced):
+        warnings.extend(checks.check_duplicate_rows(df))
+    else:
+        duplicate_mask = pl_df.select(
+            pl.struct(pl.all()).is_first_distinct().not_()
+        ).to_series()
+        positions = np.flatnonzero(duplicate_mask.to_numpy())
+
+        if len(positions) > 0:
+            warnings.append(checks._format_duplicate_rows(df.index, positions))
+
+    total_rows = len(df)
+
+    for i, (name, col) in enumerate(zip(names, df.columns)):
+        null_count = stats[f"{name}_nulls"]
+        non_null_count = total_rows - null_count
+
+        if null_count > 0:
+            percent = null_count / total_rows * 100
+            warnings.append(checks._format_missing_values(col, null_count, percent))
+
+        if coerced[i]:
+            nn = df.iloc[:, i].dropna()
+            found = [checks._mixed_types(nn), checks._whitespace(nn)]
+            found.extend(checks._constant_and_unique(nn))
+            warnings.extend(warning for warning in found if warning)
+            continue
+
+        whitespace_count = stats.get(f"{name}_whitespace")
+        if whitespace_count:
+            warnings.append(checks._format_whitespace(col, whitespace_count))
+
+        num_unique = stats[f"{name}_unique"]
+        if num_unique <= 1:
+            # Reuse the pandas formatting so the constant value prints the same
+            warning = checks._constant(df.iloc[:, i].dropna())
+            if warning:
+                warnings.append(warning)
+
+        if non_null_count > 0 and num_unique / non_null_count >= 0.95:
+            warnings.append(checks._format_unique(col, num_unique / non_null_count))
+
+        outlier_count = stats.get(f"{name}_outliers")
+        if outlier_count:
+            warnings.append(checks._format_outliers(col, outlier_count))
+
+    return warnings
+
+
+def _stat_expressions(pl_df: pl.DataFrame, threshold: float = 1.5) -> List[pl.Expr]:
+    exprs: List[pl.Expr] = []
+
+    for name, dtype in pl_df.schema.items():
+        column = pl.col(name)
+        exprs.append(column.null_count().alias(f"{name}_nulls"))
+        exprs.append(column.drop_nulls().n_unique().alias(f"{name}_unique"))
+
+        if dtype == pl.String:
+            padded = column.str.len_chars() != column.str.strip_chars().str.len_chars()
+            exprs.append(padded.sum().alias(f"{name}_whitespace"))
+
+        elif (dtype.is_numeric() and dtype != pl.Decimal) or dtype == pl.Duration:
+            # pandas routes timedelta as numeric too, compared as float64 ns, but
+            # never decimals
+            values = column.to_physical().cast(pl.Float64)
+            q1 = values.quantile(0.25, interpolation="linear")
+            q3 = values.quantile(0.75, interpolation="linear")
+            iqr = q3 - q1
+            outside = (values < q1 - threshold * iqr) | (values > q3 + threshold * iqr)
+            # Polars orders NaN above every number, so a NaN or infinite IQR
+            # (from infinite values) would flag everything; pandas flags nothing.
+            no_spread = (iqr == 0) | iqr.is_finite().not_()
+            count = pl.when(no_spread).then(0).otherwise(outside.sum())
+            exprs.append(count.alias(f"{name}_outliers"))
+
+    return exprs
@@ -0,0 +1,112 @@
+"""
+Tests for the df.lint accessor in accessor.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lintdata import checks
+from lintdata.accessor import LintAccessor
+
+
+@pytest.fixture(autouse=True)
+def clear_report_cache():
+    LintAccessor._report_cache.clear()
+    yield
+    LintAccessor._report_cache.clear()
+
+
+@pytest.fixture
+def run_all_calls(monkeypatch):
+    calls = []
+    run_all = checks.run_all
+
+    def counting_run_all(df):
+        calls.append(df)
+        return run_all(df)
+
+    monkeypatch.setattr(checks, "run_all", counting_run_all)
+    return calls
+
+
+def test_report_lists_issues():
+    df = pd.DataFrame({"a": [1, 1, np.nan], "b": ["x", "y", "z"]})
+    report = df.lint.report()
+    assert report.startswith("--- LintData Quality Report ---")
+    assert "Found 3 issue(s):" in report
+    assert "  1. [Missing Values] Column 'a'" in report
+    assert report.endswith("--- End of Report ---")
+
+
+def test_report_clean_dataframe():
+    df = pd.DataFrame({"a": [1, 2, 3, 1], "b": ["x", "y", "x", "y"]})
+    assert "No issues found." in df.lint.report()
+
+
+def test_report_empty_dataframe():
+    df = pd.DataFrame()
+    assert "The DataFrame is empty. No checks run." in df.lint.report()
+
+
+def test_report_invalid_engine():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    with pytest.raises(ValueError):
+        df.lint.report(engine="spark")
+
+
+def test_report_polars_engine_matches_pandas():
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": [1, 1, np.nan, 40], "b": [" x", "y", "z", "y"]})
+    assert df.lint.report(engine="polars") == df.lint.report()
+
+
+def test_report_is_cached_for_unchanged_content(run_all_calls):
+    df = pd.DataFrame({"a": [1, 1, np.nan], "b": ["x", "y", "z"]})
+    first = df.lint.report()
+    assert df.lint.report() == first
+    assert df.copy().lint.report() == first
+    assert len(run_all_calls) == 1
+
+
+def test_report_cache_invalidated_by_edits(run_all_calls):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    first = df.lint.report()
+    df.loc[1, "a"] = np.nan
+    second = df.lint.report()
+    assert second != first
+    assert "[Missing Values] Column 'a'" in second
+    assert len(run_all_calls) == 2
+
+
+def test_report_cache_distinguishes_values_with_equal_str(run_all_calls):
+    mixed = pd.DataFrame({"a": pd.Series([1, "x", 3], dtype=object)})
+    strings = pd.DataFrame({"a": pd.Series(["1", "x", "3"], dtype=object)})
+    assert "[Mixed Types]" in mixed.lint.report()
+    assert "[Mixed Types]" not in strings.lint.report()
+    assert strings.lint.report() == strings.lint.report(use_cache=False)
+
+
+def test_report_cache_distinguishes_categories_with_equal_str(run_all_calls):
+    mixed = pd.DataFrame({"a": pd.Categorical([1, "1", 1])})
+    strings = pd.DataFrame({"a": pd.Categorical(["1", "1", "1"])})
+    assert "[Constant Column]" not in mixed.lint.report()
+    assert "[Constant Column]" in strings.lint.report()
+    assert strings.lint.report() == strings.lint.report(use_cache=False)
+
+
+def test_report_cache_distinguishes_equal_column_labels(run_all_calls):
+    int_label = pd.DataFrame({1: [7, 7, 7]})
+    float_label = pd.DataFrame({1.0: [7, 7, 7]})
+    assert "Column '1'" in int_label.lint.report()
+    assert "Column '1.0'" in float_label.lint.report()
+    assert len(run_all_calls) == 2
+
+
+def test_report_use_cache_false(run_all_calls):
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    df.lint.report(use_cache=False)
+    df.lint.report(use_cache=False)
+    assert len(run_all_calls) == 2
+    assert LintAccessor._report_cache == {}
@@ -2,8 +2,11 @@
 Tests for the individual check functions in checks.py
 """
 
+import datetime
+
 import numpy as np
 import pandas as pd
+import pytest
 
 from lintdata import checks
 
@@ -15,6 +18,12 @@ def test_check_missing_values_clean():
     assert warnings == []
 
 
+def test_check_missing_values_empty_dataframe():
+    """Edge case: empty DataFrame should return no warnings."""
+    assert checks.check_missing_values(pd.DataFrame()) == []
+    assert checks.check_missing_values(pd.DataFrame({"a": []}, dtype=object)) == []
+
+
 def test_check_missing_values_one_column_missing():
     """Test detection and correct reporting for one missing value."""
     df = pd.DataFrame({"a": [1, 2, np.nan], "b": ["x", "y", "z"]})
@@ -56,6 +65,40 @@ def test_check_missing_values_all_missing():
     assert "(100.0%)" in warnings[0]
 
 
+def test_check_missing_values_mixed_dtypes():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3, 4],
+            "nullable": pd.array([1, None, 3, None], dtype="Int64"),
+            "float": [1.0, np.nan, 3.0, 4.0],
+            "text": ["x", None, "z", "w"],
+            "when": pd.to_datetime(["2024-01-01", None, None, None]),
+            "flag": [True, False, True, False],
+        }
+    )
+    warnings = checks.check_missing_values(df)
+    assert warnings == checks.check_missing_values(df, na_counts=df.isna().sum())
+    assert len(warnings) == 4
+    assert "Column 'nullable': 2 missing values (50.0%)" in warnings[0]
+    assert "Column 'when': 3 missing values (75.0%)" in warnings[3]
+
+
+def test_checks_accept_precomputed_na_mask():
+    df = pd.DataFrame({"a": [1, 1, np.nan], "b": [" x", np.nan, "y"]})
+    na_mask = df.isna()
+
+    assert checks.check_missing_values(
+        df, na_counts=na_mask.sum()
+    ) == checks.check_missing_values(df)
+    assert checks.check_constant_columns(
+        df, na_mask=na_mask
+    ) == checks.check_constant_columns(df)
+    assert checks.check_mixed_types(df, na_mask=na_mask) == []
+    assert checks.check_unique_columns(
+        df, na_counts=na_mask.sum()
+    ) == checks.check_unique_columns(df)
+
+
 # ==== Tests for check_duplicate_rows ====
 
 
@@ -115,6 +158,47 @@ def test_check_duplicate_rows_multiple_duplicates_sets():
     assert "index: 2, 4, 5" in warnings[0]
 
 
+def test_check_duplicate_rows_caps_listed_indices():
+    df = pd.DataFrame({"a": [1] * 61})
+    warnings = checks.check_duplicate_rows(df)
+    assert len(warnings) == 1
+    assert "Found 60 duplicate row(s)" in warnings[0]
+    assert warnings[0].endswith("49, 50, ... (+10 more)")
+
+
+def test_check_duplicate_rows_unique_column_with_repeats_elsewhere():
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["Bob", "Bob", "Bob"]})
+    warnings = checks.check_duplicate_rows(df)
+    assert warnings == []
+
+
+def test_check_duplicate_rows_missing_values_match():
+    df = pd.DataFrame({"a": [1, np.nan, np.nan], "b": ["x", "y", "y"]})
+    warnings = checks.check_duplicate_rows(df)
+    assert len(warnings) == 1
+    assert "index: 2" in warnings[0]
+
+
+def test_check_duplicate_rows_float16_columns():
+    sorted_id = pd.DataFrame({"id": np.array([1, 2, 3], dtype=np.float16)})
+    assert checks.check_duplicate_rows(sorted_id) == []
+
+    df = pd.DataFrame(
+        {"a": np.array([1, 2, 1, 3], dtype=np.float16), "b": ["x", "y", "x", "z"]}
+    )
+    warnings = checks.check_duplicate_rows(df)
+    assert warnings == ["[Duplicate Rows] Found 1 duplicate row(s) at index: 2"]
+
+
+def test_check_duplicate_rows_single_row_and_duplicate_column_names():
+    assert checks.check_duplicate_rows(pd.DataFrame({"a": [1]})) == []
+
+    df = pd.DataFrame([["x", 1, 1], ["x", 1, 1]], columns=["a", "b", "b"])
+    warnings = checks.check_duplicate_rows(df)
+    assert len(warnings) == 1
+    assert "index: 1" in warnings[0]
+
+
 # ==== Mixed Type Tests ====
 
 
@@ -171,6 +255,58 @@ def test_check_mixed_types_multiple_columns():
     assert any("Column 'col4'" in warning for warning in warnings)
 
 
+def test_check_mixed_types_int_and_float():
+    df = pd.DataFrame({"a": pd.Series([1, 2.5, 3], dtype=object)})
+    warnings = checks.check_mixed_types(df)
+    assert len(warnings) == 1
+    assert "int (67%)" in warnings[0]
+    assert "float (33%)" in warnings[0]
+
+
+def test_check_mixed_types_numpy_and_python_scalars():
+    df = pd.DataFrame({"a": pd.Series([1, np.int64(2), 3], dtype=object)})
+    warnings = checks.check_mixed_types(df)
+    assert warnings == []
+
+
+def test_check_mixed_types_date_and_datetime():
+    day, moment = datetime.date(2020, 1, 1), datetime.datetime(2020, 1, 1, 12)
+    df = pd.DataFrame(
+        {
+            "mixed": pd.Series([day, moment], dtype=object),
+            "dates": pd.Series([day, day], dtype=object),
+        }
+    )
+    warnings = checks.check_mixed_types(df)
+    assert warnings == [
+        "[Mixed Types] Column 'mixed' has mixed types: date (50%), datetime (50%)"
+    ]
+
+
+def test_check_mixed_types_str_and_bytes():
+    df = pd.DataFrame({"a": pd.Series(["x ", b"y", "z"], dtype=object)})
+    warnings = checks.run_all(df)
+    assert any("has mixed types: str (67%), bytes (33%)" in w for w in warnings)
+
+
+def test_check_mixed_types_sampled_prefix(monkeypatch):
+    monkeypatch.setattr(checks, "_MIXED_TYPES_SAMPLE_SIZE", 4)
+    df = pd.DataFrame({"a": pd.Series([1, "x", 2, "y", 3, 4, 5, 6], dtype=object)})
+    warnings = checks.check_mixed_types(df)
+    assert len(warnings) == 1
+    assert "int (50%)" in warnings[0]
+    assert "(in the first 4 non-null values)" in warnings[0]
+
+
+def test_check_mixed_types_beyond_sampled_prefix(monkeypatch):
+    monkeypatch.setattr(checks, "_MIXED_TYPES_SAMPLE_SIZE", 4)
+    df = pd.DataFrame({"a": pd.Series([1, 2, 3, 4, 5, 6, 7, "x"], dtype=object)})
+    warnings = checks.check_mixed_types(df)
+    assert len(warnings) == 1
+    assert "int (88%)" in warnings[0]
+    assert "first" not in warnings[0]
+
+
 # ==== Whitespace Tests ====
 
 
@@ -237,6 +373,59 @@ def test_check_whitespace_nan_values():
     assert "2 value(s)" in warnings[0]
 
 
+def test_check_whitespace_ignores_non_string_objects():
+    df = pd.DataFrame({"a": [1, " x", 2.5, None], "b": [True, False, None, True]})
+    warnings = checks.check_whitespace(df)
+    assert len(warnings) == 1
+    assert "Column 'a'" in warnings[0]
+    assert "1 value(s)" in warnings[0]
+
+
+def test_check_whitespace_string_dtype():
+    df = pd.DataFrame({"a": pd.array([" x", None, "y", "z\t"], dtype="string")})
+    warnings = checks.check_whitespace(df)
+    assert len(warnings) == 1
+    assert "Column 'a' has 2 value(s)" in warnings[0]
+
+
+def test_check_whitespace_arrow_dtype():
+    pa = pytest.importorskip("pyarrow")
+    values = [" x", None, "y", "z\t"]
+    df = pd.DataFrame(
+        {
+            "a": pd.Series(values, dtype=pd.ArrowDtype(pa.string())),
+            "b": pd.Series(values, dtype=pd.ArrowDtype(pa.large_string())),
+            "c": pd.Series([1, 2, 3, 4], dtype=pd.ArrowDtype(pa.int64())),
+        }
+    )
+    warnings = checks.check_whitespace(df)
+    assert len(warnings) == 2
+    assert "Column 'a' has 2 value(s)" in warnings[0]
+    assert "Column 'b' has 2 value(s)" in warnings[1]
+
+
+def test_check_whitespace_without_pyarrow(monkeypatch):
+    df = pd.DataFrame(
+        {
+            "a": [" x", np.nan, "z "],
+            "b": [1, " x", 2.5],
+            "c": pd.array([" x", None, "y"], dtype="string"),
+        }
+    )
+    expected = checks.check_whitespace(df)
+
+    monkeypatch.setattr(checks, "pa", None)
+    assert checks.check_whitespace(df) == expected
+
+
+def test_check_whitespace_without_pyarrow_control_whitespace(monkeypatch):
+    monkeypatch.setattr(checks, "pa", None)
+    df = pd.DataFrame({"a": ["x\n", "\ty", "a b", "z", "\u00a0w", "line\nbreak"]})
+    warnings = checks.check_whitespace(df)
+    assert len(warnings) == 1
+    assert "3 value(s)" in warnings[0]
+
+
 # === Check Constant Columns Tests ====
 
 
@@ -307,6 +496,57 @@ def test_check_constant_columns_boolean_constant():
     assert "only one unique value: True" in warnings[0]
 
 
+def test_check_constant_columns_boolean_columns():
+    df = pd.DataFrame(
+        {
+            "false": [False, False, False],
+            "mixed": [True, False, True],
+            "nullable": pd.array([None, False, False], dtype="boolean"),
+        }
+    )
+    warnings = checks.check_constant_columns(df)
+    assert len(warnings) == 2
+    assert "Column 'false' has only one unique value: False" in warnings[0]
+    assert "Column 'nullable' has only one unique value: False" in warnings[1]
+
+
+def test_check_constant_columns_tuple_values():
+    df = pd.DataFrame(
+        {
+            "pairs": [(1, 2)] * 3,
+            "triples": [(1, 2, 3)] * 3,
+            "varying": [(1, 2), (1, 3), (1, 2)],
+        }
+    )
+    warnings = checks.check_constant_columns(df)
+    assert warnings == [
+        "[Constant Column] Column 'pairs' has only one unique value: (1, 2).",
+        "[Constant Column] Column 'triples' has only one unique value: (1, 2, 3).",
+    ]
+
+
+def test_check_constant_columns_datetime_and_timedelta():
+    df = pd.DataFrame(
+        {
+            "when": pd.to_datetime(["2020-01-01"] * 3),
+            "delta": pd.to_timedelta([1, 1, 1], unit="D"),
+        }
+    )
+    warnings = checks.check_constant_columns(df)
+    assert warnings == [
+        "[Constant Column] Column 'when' has only one unique value: "
+        "2020-01-01 00:00:00.",
+        "[Constant Column] Column 'delta' has only one unique value: 1 days 00:00:00.",
+    ]
+
+
+def test_check_constant_columns_long_columns():
+    df = pd.DataFrame({"a": [2.5] * 3000, "b": [1] * 2999 + [2]})
+    warnings = checks.check_constant_columns(df)
+    assert len(warnings) == 1
+    assert "Column 'a' has only one unique value: 2.5" in warnings[0]
+
+
 # ==== Unique Columns Test ====
 
 
@@ -369,6 +609,43 @@ def test_check_unique_columns_multiple_unique_columns():
     assert any("Column 'b'" in warning for warning in warnings)
 
 
+def test_check_unique_columns_sorted_columns():
+    df = pd.DataFrame({"a": [1, 1, 2, 3], "b": [4.0, 3.0, 2.0, 1.0]})
+    warnings = checks.check_unique_columns(df, threshold=0.7)
+    assert len(warnings) == 2
+    assert "Column 'a' is 75.0% unique" in warnings[0]
+    assert "Column 'b' is 100.0% unique" in warnings[1]
+
+
+def test_check_unique_columns_float16():
+    df = pd.DataFrame(
+        {
+            "sorted": np.array([1, 2, 3, 4], dtype=np.float16),
+            "shuffled": np.array([3, 1, 4, 2], dtype=np.float16),
+            "repeated": np.array([1, 1, 2, 2], dtype=np.float16),
+        }
+    )
+    warnings = checks.check_unique_columns(df)
+    assert len(warnings) == 2
+    assert "Column 'sorted' is 100.0% unique" in warnings[0]
+    assert "Column 'shuffled' is 100.0% unique" in warnings[1]
+
+
+def test_check_unique_columns_narrow_integer_and_bool_ranges():
+    df = pd.DataFrame(
+        {
+            "narrow": [3, 1, 2, 3, 1, 2],
+            "wide": [10, -5, 7, 2**40, 0, 3],
+            "flag": [True, False, True, False, True, False],
+            "big": np.array([0, 2**64 - 1, 5, 9, 1, 2], dtype=np.uint64),
+        }
+    )
+    warnings = checks.check_unique_columns(df)
+    assert len(warnings) == 2
+    assert "Column 'wide'" in warnings[0]
+    assert "Column 'big'" in warnings[1]
+
+
 # ==== Outliers Tests ====
 
 
@@ -405,3 +682,255 @@ def test_check_outliers_custom_threshold():
     assert "potential outlier(s)" in warnings_low[0]
     assert "Column 'b'" in warnings_low[1]
     assert "potential outlier(s)" in warnings_low[1]
+
+
+def test_check_outliers_nullable_and_missing_values():
+    df = pd.DataFrame(
+        {
+            "a": pd.array([10, 12, 11, 13, 100, None], dtype="Int64"),
+            "b": [1.0, 2.0, np.nan, 3.0, 4.0, 2.5],
+        }
+    )
+    warnings = checks.check_outliers(df)
+    assert len(warnings) == 1
+    assert "Column 'a': 1 potential outlier(s)" in warnings[0]
+
+
+def test_check_outliers_infinite_values(recwarn):
+    df = pd.DataFrame(
+        {
+            "a": [np.inf] * 5 + [1.0, 2.0],
+            "b": [-np.inf, 1.0, 2.0, 3.0, np.inf, 4.0, 5.0],
+        }
+    )
+    warnings = checks.check_outliers(df)
+    assert len(warnings) == 1
+    assert "Column 'b': 2 potential outlier(s)" in warnings[0]
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+def test_check_outliers_exact_quartile_next_to_infinity():
+    # Q3 sits exactly on 0.0; its infinite neighbour must not turn it into NaN
+    df = pd.DataFrame({"a": [0.0, -4.0, np.inf, -2.0, -1.0]})
+    warnings = checks.check_outliers(df)
+    assert warnings == [
+        "[Outliers] Column 'a': 1 potential outlier(s) detected (iqr method)."
+    ]
+
+
+def test_check_outliers_timedelta_with_missing_values():
+    df = pd.DataFrame({"a": pd.to_timedelta([1, 2, None, 3, 500], unit="D")})
+    warnings = checks.check_outliers(df)
+    assert warnings == [
+        "[Outliers] Column 'a': 1 potential outlier(s) detected (iqr method)."
+    ]
+
+
+def test_check_outliers_skips_complex_columns(recwarn):
+    df = pd.DataFrame({"a": [1 + 1j, 2j, 3 + 0j, 4 + 0j, 100 + 0j]})
+    assert checks.check_outliers(df) == []
+    assert not [
+        w for w in recwarn if issubclass(w.category, np.exceptions.ComplexWarning)
+    ]
+
+
+def test_check_outliers_arrow_decimal_and_duration():
+    pa = pytest.importorskip("pyarrow")
+    values = list(range(39)) + [None, 1000]
+    df = pd.DataFrame(
+        {
+            "decimal": pd.Series(values, dtype=pd.ArrowDtype(pa.decimal128(6, 0))),
+            "duration": pd.Series(values, dtype=pd.ArrowDtype(pa.duration("s"))),
+        }
+    )
+    # select_dtypes(np.number) leaves decimals out but keeps durations
+    warnings = checks.check_outliers(df)
+    assert warnings == [
+        "[Outliers] Column 'duration': 1 potential outlier(s) detected (iqr method)."
+    ]
+
+
+def test_iqr_outlier_counts_match_np_quantile():
+    rng = np.random.default_rng(1)
+    for n in [1, 2, 3, 4, 5, 10, 11, 101]:
+        values = rng.standard_t(df=2, size=(n, 3))
+        q1, q3 = np.quantile(values, [0.25, 0.75], axis=0)
+        iqr = q3 - q1
+        outside = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+        expected = np.where(iqr == 0, 0, outside.sum(axis=0))
+        np.testing.assert_array_equal(checks._iqr_outlier_counts(values, 1.5), expected)
+
+
+def test_iqr_outlier_counts_with_ties_and_infinities():
+    rng = np.random.default_rng(2)
+    for n in [4, 7, 12, 50, 257]:
+        values = np.round(rng.standard_t(df=2, size=(n, 4)))
+        values[0, 1] = np.inf
+        values[-1, 2] = -np.inf
+        for threshold in [0.1, 1.5, 3.0]:
+            with np.errstate(invalid="ignore"):
+                q1, q3 = np.quantile(values, [0.25, 0.75], axis=0)
+                iqr = q3 - q1
+                lower, upper = q1 - threshold * iqr, q3 + threshold * iqr
+            outside = (values < lower) | (values > upper)
+            expected = np.where(iqr == 0, 0, outside.sum(axis=0))
+            np.testing.assert_array_equal(
+                checks._iqr_outlier_counts(values, threshold), expected
+            )
+
+
+def test_iqr_outlier_counts_numba_matches_numpy():
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(500, 4))
+    values[::9, 1] = np.nan
+    values[:, 2] = 1.0
+    values[:, 3] = np.nan
+
+    expected = checks._iqr_outlier_counts(values, 1.5)
+    assert expected[0] > 0
+    assert list(expected[2:]) == [0, 0]
+    np.testing.assert_array_equal(checks._iqr_outlier_counts_jit(values, 1.5), expected)
+
+
+def test_outliers_use_numba_only_when_asked(monkeypatch):
+    def fail(values, threshold):
+        raise AssertionError("the Numba kernel was not requested")
+
+    monkeypatch.setattr(checks, "_iqr_outlier_counts_jit", fail)
+    df = pd.DataFrame(np.zeros((100_000, 2)), columns=["a", "b"])
+    assert checks.check_outliers(df) == []
+    assert checks.run_all(df)[-1].startswith("[Constant Column] Column 'b'")
+
+    with pytest.raises(AssertionError):
+        checks.check_outliers(df, use_numba=True)
+
+
+def test_outliers_use_numba_requires_numba(monkeypatch):
+    monkeypatch.setattr(checks, "_iqr_outlier_counts_jit", None)
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    assert checks.check_outliers(df) == []
+    with pytest.raises(ImportError):
+        checks.check_outliers(df, use_numba=True)
+
+
+# ==== run_all Tests ====
+
+
+def test_run_all_matches_individual_checks():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, np.nan, 4, 100, 2],
+            "b": [" x", "y", "z", "w", "v", "y"],
+            "c": [7, 7, 7, 7, 7, 7],
+            "d": [1, "two", 3, 4, 5, 6],
+        }
+    )
+    expected = (
+        checks.check_missing_values(df)
+        + checks.check_duplicate_rows(df)
+        + checks.check_mixed_types(df)
+        + checks.check_whitespace(df)
+        + checks.check_constant_columns(df)
+        + checks.check_unique_columns(df)
+        + checks.check_outliers(df)
+    )
+    warnings = checks.run_all(df)
+    assert sorted(warnings) == sorted(expected)
+
+
+def test_run_all_constant_columns_in_short_frames():
+    df = pd.DataFrame({"a": [5.0, np.nan], "b": [True, True], "c": ["x", None]})
+    warnings = checks.run_all(df)
+    assert "[Constant Column] Column 'a' has only one unique value: 5.0." in warnings
+    assert "[Unique Column] Column 'a' is 100.0% unique" in warnings
+    assert "[Constant Column] Column 'b' has only one unique value: True." in warnings
+    assert not any("[Unique Column] Column 'b'" in w for w in warnings)
+    assert "[Unique Column] Column 'c' is 100.0% unique" in warnings
+
+
+def test_run_all_orders_by_column():
+    df = pd.DataFrame({"a": [1, 1, np.nan], "b": ["x", "y", "z"]})
+    warnings = checks.run_all(df)
+    assert len(warnings) == 3
+    assert "[Missing Values] Column 'a'" in warnings[0]
+    assert "[Constant Column] Column 'a'" in warnings[1]
+    assert "[Unique Column] Column 'b'" in warnings[2]
+
+
+def test_run_all_streams_to_emit():
+    df = pd.DataFrame({"a": [1, 1, np.nan], "b": ["x", "y", "z"]})
+    emitted = []
+    returned = checks.run_all(df, emit=emitted.append)
+    assert returned == []
+    assert emitted == checks.run_all(df)
+
+
+def test_run_all_empty_dataframe():
+    df = pd.DataFrame()
+    warnings = checks.run_all(df)
+    assert warnings == []
+
+
+def test_run_all_parallel_matches_sequential(monkeypatch):
+    df = pd.DataFrame({f"c{i}": [i, i, np.nan, i * 10, " x"] for i in range(10)})
+    sequential = checks.run_all(df)
+
+    monkeypatch.setattr(checks.os, "cpu_count", lambda: 4)
+    parallel = checks.run_all(df)
+    assert parallel == sequential
+
+    emitted = []
+    checks.run_all(df, emit=emitted.append)
+    assert emitted == sequential
+
+
+def test_column_checks_parallel_match_sequential(monkeypatch):
+    df = pd.DataFrame({f"c{i}": [i, "x ", i, np.nan, i] for i in range(10)})
+    column_checks = [
+        checks.check_mixed_types,
+        checks.check_whitespace,
+        checks.check_constant_columns,
+        checks.check_unique_columns,
+    ]
+    sequential = [check(df) for check in column_checks]
+
+    monkeypatch.setattr(checks.os, "cpu_count", lambda: 4)
+    assert [check(df) for check in column_checks] == sequential
+    assert all(sequential[:2])
+
+
+# ==== Column Classification Tests ====
+
+
+def test_classify_columns_matches_select_dtypes():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "int": [1, 2],
+            "float": [1.0, 2.0],
+            "bool": [True, False],
+            "object": ["a", "b"],
+            "Int64": pd.array([1, None], dtype="Int64"),
+            "boolean": pd.array([True, None], dtype="boolean"),
+            "string": pd.array(["a", None], dtype="string"),
+            "arrow_int": pd.Series([1, 2], dtype=pd.ArrowDtype(pa.int64())),
+            "arrow_str": pd.Series(["a", "b"], dtype=pd.ArrowDtype(pa.string())),
+            "arrow_bool": pd.Series([True, False], dtype=pd.ArrowDtype(pa.bool_())),
+            "arrow_duration": pd.Series([1, 2], dtype=pd.ArrowDtype(pa.duration("s"))),
+            "category": pd.Categorical(["a", "b"]),
+            "datetime": pd.to_datetime(["2020-01-01", "2021-01-01"]),
+            "timedelta": pd.to_timedelta([1, 2], unit="s"),
+            "complex": [1 + 1j, 2j],
+            "sparse": pd.arrays.SparseArray([0, 1]),
+        }
+    )
+    kinds = checks._classify_columns(df)
+
+    numeric = df.select_dtypes(include=[np.number], exclude=[np.complexfloating])
+    numeric = numeric.columns
+    objects = df.select_dtypes(include=["object"]).columns
+    strings = df.select_dtypes(include=["object", "string"]).columns
+    assert list(df.columns[kinds.numeric]) == list(numeric)
+    assert list(df.columns[kinds.objects]) == list(objects)
+    assert list(df.columns[kinds.strings]) == list(strings)
@@ -0,0 +1,102 @@
+"""
+Tests for the Polars-backed run_all in polars_engine.py
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lintdata import checks
+
+pytest.importorskip("polars")
+pytest.importorskip("pyarrow")
+
+from lintdata import polars_engine  # noqa: E402
+
+
+def test_polars_run_all_matches_pandas():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, np.nan, 4, 100, 2],
+            "b": [" x", "y", "z", "w", "v", "y"],
+            "c": [7, 7, 7, 7, 7, 7],
+            "d": [1.5, 2.0, 3.0, 4.0, 5.0, 6.0],
+        }
+    )
+    assert polars_engine.run_all(df) == checks.run_all(df)
+
+    seconds = list(range(38)) + [None, 1000]
+    durations = pd.DataFrame({"t": pd.to_timedelta(seconds, unit="s")})
+    assert "[Outliers] Column 't': 1 potential" in checks.run_all(durations)[-1]
+    assert polars_engine.run_all(durations) == checks.run_all(durations)
+
+    infinities = pd.DataFrame({"x": [np.inf, 1.0, 2.0, -np.inf] * 10})
+    assert not any("[Outliers]" in w for w in checks.run_all(infinities))
+    assert polars_engine.run_all(infinities) == checks.run_all(infinities)
+
+
+def test_polars_run_all_duplicate_rows_use_index_labels():
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 2, 3, 3, 3],
+            "name": ["Alice", "Bob", "Bob", "Charlie", "Charlie", "Charlie"],
+        },
+        index=list("abcdef"),
+    )
+    warnings = polars_engine.run_all(df)
+    assert "[Duplicate Rows] Found 3 duplicate row(s) at index: c, e, f" in warnings
+    assert warnings == checks.run_all(df)
+
+
+def test_polars_run_all_constant_and_missing_columns():
+    df = pd.DataFrame(
+        {
+            "a": [np.nan, np.nan, np.nan],
+            "b": [True, True, True],
+            "c": pd.array([1, None, 1], dtype="Int64"),
+        }
+    )
+    assert polars_engine.run_all(df) == checks.run_all(df)
+
+
+def test_polars_run_all_mixed_types():
+    df = pd.DataFrame({"a": [1, 2.5, 3], "b": [1, "two", 3]}, dtype=object)
+    warnings = polars_engine.run_all(df)
+    assert any("[Mixed Types] Column 'a'" in warning for warning in warnings)
+    assert any("[Mixed Types] Column 'b'" in warning for warning in warnings)
+    assert warnings == checks.run_all(df)
+
+
+def test_polars_run_all_object_columns_coerced_by_polars():
+    # Polars reads both cells as the same datetime; pandas sees two values
+    df = pd.DataFrame(
+        {
+            "a": [datetime.date(2020, 1, 1), datetime.datetime(2020, 1, 1)],
+            "b": [1, 1],
+        }
+    )
+    warnings = polars_engine.run_all(df)
+    assert None not in warnings
+    assert warnings == checks.run_all(df)
+
+
+def test_polars_run_all_falls_back_for_unsupported_columns():
+    df = pd.DataFrame({"z": [1 + 1j, 2j, 3 + 0j, 4 + 0j, 100 + 0j]})
+    assert polars_engine.run_all(df) == checks.run_all(df)
+
+
+def test_polars_run_all_skips_outliers_for_decimals():
+    pa = pytest.importorskip("pyarrow")
+    values = list(range(39)) + [None, 1000]
+    df = pd.DataFrame(
+        {"d": pd.Series(values, dtype=pd.ArrowDtype(pa.decimal128(6, 0)))}
+    )
+    assert not any("[Outliers]" in w for w in polars_engine.run_all(df))
+    assert polars_engine.run_all(df) == checks.run_all(df)
+
+
+def test_polars_run_all_empty_dataframe():
+    df = pd.DataFrame()
+    assert polars_engine.run_all(df) == []